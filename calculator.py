@@ -1,17 +1,14 @@
 import time
 import sys
+import types
 import ast
+import functools
+import importlib.util
 import operator
-try:
-    import tkinter as tk
-    from tkinter import ttk
-    from tkinter import font as tkfont
-except Exception:
-    tk = None
-    tkfont = None
+import re
 
 # Lines to print with 2 second delay
-MESSAGES = [
+MESSAGES = (
     "calculating...",
     "Going physical with codes...",
     "Asking Calculator God...",
@@ -21,7 +18,11 @@ MESSAGES = [
     "Oops! Your mom is busy making breakfast...",
     "Checking Meesho discounts...",
     "Almost there...",
-]
+)
+
+# (message, bold) pairs for the GUIs, which show every other message in bold
+_MSG_STREAM = tuple((msg, bool(i % 2)) for i, msg in enumerate(MESSAGES))
+
 
 # Safe eval: allow basic arithmetic only
 ALLOWED_OPERATORS = {
@@ -37,63 +38,247 @@ ALLOWED_OPERATORS = {
 }
 
 
+# Exact types accepted for constants: the numbers ast.Num used to match (bool is
+# deliberately excluded)
+_NUMBER_TYPES = (int, float, complex)
+
+
+def _eval_expr(node):
+    return _eval_node(node.body)
+
+
+def _eval_binop(node):
+    left = _eval_node(node.left)
+    right = _eval_node(node.right)
+    try:
+        fn = ALLOWED_OPERATORS[type(node.op)]
+    except KeyError:
+        raise ValueError(f"Operator {type(node.op)} not allowed") from None
+    return fn(left, right)
+
+
+def _eval_unop(node):
+    operand = _eval_node(node.operand)
+    try:
+        fn = ALLOWED_OPERATORS[type(node.op)]
+    except KeyError:
+        raise ValueError(f"Unary operator {type(node.op)} not allowed") from None
+    return fn(operand)
+
+
+def _eval_const(node):
+    if type(node.value) not in _NUMBER_TYPES:
+        raise ValueError("Only int/float constants are allowed")
+    return node.value
+
+
+# Keyed on the exact node class; ast.Constant covers what ast.Num matched before 3.8
+_HANDLERS = {
+    ast.Expression: _eval_expr,
+    ast.BinOp: _eval_binop,
+    ast.UnaryOp: _eval_unop,
+    ast.Constant: _eval_const,
+}
+
+
+def _eval_node(node):
+    handler = _HANDLERS.get(type(node))
+    if handler is None:
+        raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+    return handler(node)
+
+
 def safe_eval(node):
+    return _eval_node(node)
+
+
+def _parse(expr: str) -> ast.Expression:
+    return ast.parse(expr, mode='eval')
+
+
+def _validate(node):
+    # Same checks as safe_eval, in the same depth-first, left-to-right order, done
+    # once so the tree can be handed to compile()
+    node_type = type(node)
+    if node_type is ast.Expression:
+        _validate(node.body)
+    elif node_type is ast.BinOp:
+        _validate(node.left)
+        _validate(node.right)
+        if type(node.op) not in ALLOWED_OPERATORS:
+            raise ValueError(f"Operator {type(node.op)} not allowed")
+    elif node_type is ast.UnaryOp:
+        _validate(node.operand)
+        if type(node.op) not in ALLOWED_OPERATORS:
+            raise ValueError(f"Unary operator {type(node.op)} not allowed")
+    elif node_type is ast.Constant:
+        if type(node.value) not in _NUMBER_TYPES:
+            raise ValueError("Only int/float constants are allowed")
+    else:
+        raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+
+def _is_number(node):
+    return isinstance(node, ast.Constant) and type(node.value) in _NUMBER_TYPES
+
+
+def _fold(node):
+    # Bottom-up: operators whose operands are both numbers become a single constant
     if isinstance(node, ast.Expression):
-        return safe_eval(node.body)
+        return ast.Expression(body=_fold(node.body))
     if isinstance(node, ast.BinOp):
-        left = safe_eval(node.left)
-        right = safe_eval(node.right)
-        op_type = type(node.op)
-        if op_type in ALLOWED_OPERATORS:
-            return ALLOWED_OPERATORS[op_type](left, right)
-        raise ValueError(f"Operator {op_type} not allowed")
+        left = _fold(node.left)
+        right = _fold(node.right)
+        if _is_number(left) and _is_number(right):
+            value = ALLOWED_OPERATORS[type(node.op)](left.value, right.value)
+            return ast.copy_location(ast.Constant(value=value), node)
+        return ast.copy_location(ast.BinOp(left=left, op=node.op, right=right), node)
     if isinstance(node, ast.UnaryOp):
-        operand = safe_eval(node.operand)
-        op_type = type(node.op)
-        if op_type in ALLOWED_OPERATORS:
-            return ALLOWED_OPERATORS[op_type](operand)
-        raise ValueError(f"Unary operator {op_type} not allowed")
-    if isinstance(node, ast.Num):
-        return node.n
-    if isinstance(node, ast.Constant):  # Python 3.8+
-        if isinstance(node.value, (int, float)):
-            return node.value
-        raise ValueError("Only int/float constants are allowed")
-    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+        operand = _fold(node.operand)
+        if _is_number(operand):
+            value = ALLOWED_OPERATORS[type(node.op)](operand.value)
+            return ast.copy_location(ast.Constant(value=value), node)
+        return ast.copy_location(ast.UnaryOp(op=node.op, operand=operand), node)
+    return node
+
+
+def _compile(expr: str):
+    # Returns the result itself when the whole tree folds to a constant, else a code object
+    tree = _parse(expr)
+    _validate(tree)
+    tree = _fold(tree)
+    if _is_number(tree.body):
+        return tree.body.value
+    return compile(tree, '<calc>', 'eval')
+
+
+# A plain int/float literal, optionally signed. Like the grammar it takes ASCII
+# digits only, with single underscores allowed between digits (1_000).
+_DIGITS = r'[0-9](?:_?[0-9])*'
+# Use fullmatch: '$' would also allow a trailing newline.
+_NUM_RE = re.compile(rf'[+-]?(?:{_DIGITS}\.?(?:{_DIGITS})?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?')
+
+
+def _parse_number(text):
+    # int/float literal or None; the regex keeps out names float() would
+    # accept, like 'nan' and 'inf', which the expression grammar does not
+    if not _NUM_RE.fullmatch(text):
+        return None
+    digits = text.lstrip('+-')
+    try:
+        if not any(ch in digits for ch in '.eE'):
+            # '007' is not a valid literal; leave it to the parser to reject
+            if digits[0] == '0' and digits.strip('0_'):
+                return None
+            return int(text)
+        return float(text)
+    except ValueError:
+        # e.g. more digits than int() allows; the parser reports these too
+        return None
 
 
-def evaluate_expression(expr: str):
+# Namespaces for evaluating compiled expressions. They contain no names and are
+# never written to, since validated code only loads constants.
+_EVAL_GLOBALS = {'__builtins__': {}}
+_EVAL_LOCALS = {}
+
+
+class _Err:
+    # Cached stand-in for a failed evaluation, so repeat bad input is not re-parsed
+    __slots__ = ('msg',)
+
+    def __init__(self, msg):
+        self.msg = msg
+
+
+def _eval_impl(expr: str):
     # Special case: exact '2 + 2' (allow surrounding whitespace)
-    if expr.strip() == '2 + 2' or expr.strip() == '2+2':
+    if expr == '2 + 2' or expr == '2+2':
         return 5
+    # A bare number needs no parsing at all
+    number = _parse_number(expr)
+    if number is not None:
+        return number
     try:
-        parsed = ast.parse(expr, mode='eval')
-        return safe_eval(parsed)
+        # Validated trees only contain arithmetic, so plain eval with no builtins is safe
+        compiled = _compile(expr)
+        if isinstance(compiled, types.CodeType):
+            return eval(compiled, _EVAL_GLOBALS, _EVAL_LOCALS)
+        return compiled
     except Exception as e:
-        raise ValueError(f"Invalid expression: {e}")
+        return _Err(f"Invalid expression: {e}")
+
+
+# The only cache layer: parsing and compiling happen on a miss here, so
+# caching them separately could never hit
+@functools.lru_cache(maxsize=256)
+def _eval_cached(expr: str):
+    return _eval_impl(expr)
+
+
+def evaluate_expression(expr: str):
+    result = _eval_cached(expr.strip())
+    if isinstance(result, _Err):
+        raise ValueError(result.msg)
+    return result
+
+
+# Binary operators recognised in an unquoted `a op b` command line
+_OP_MAP = {
+    '+': ast.Add,
+    '-': ast.Sub,
+    '*': ast.Mult,
+    '/': ast.Div,
+    '%': ast.Mod,
+}
+
+
+def _evaluate_tokens(tokens):
+    # Command lines shaped like `2 * 3` are already split into tokens, so build
+    # the BinOp directly instead of joining and re-parsing; anything else
+    # (including the '2 + 2' special case) goes through evaluate_expression
+    if len(tokens) == 3 and tokens[1] in _OP_MAP and tokens != ['2', '+', '2']:
+        left = _parse_number(tokens[0])
+        right = _parse_number(tokens[2])
+        if left is not None and right is not None:
+            node = ast.BinOp(ast.Constant(left), _OP_MAP[tokens[1]](), ast.Constant(right))
+            try:
+                return safe_eval(node)
+            except Exception as e:
+                raise ValueError(f"Invalid expression: {e}")
+    return evaluate_expression(' '.join(tokens))
 
 
 def main():
-    if len(sys.argv) > 1:
-        expr = ' '.join(sys.argv[1:])
-    else:
+    # Everything except --no-delay is part of the expression, so arguments like
+    # `-2*3` or `-h` must not go through an option parser
+    args = sys.argv[1:]
+    no_delay = '--no-delay' in args
+    tokens = [a for a in args if a != '--no-delay']
+
+    if not tokens:
         # No command-line args: launch keypad GUI by default if available, otherwise prompt
-        if tk is not None:
-            run_keypad_gui()
+        # find_spec only locates tkinter, so CLI runs don't pay for importing it;
+        # the package can exist without _tkinter, so still prompt if the GUI fails
+        if importlib.util.find_spec('tkinter') is not None and run_keypad_gui():
             return
         try:
-            expr = input('Enter expression (e.g. 2 + 2): ')
+            tokens = [input('Enter expression (e.g. 2 + 2): ')]
         except EOFError:
             print('No input provided')
             return
 
-    # Print the messages with 2 second interval (CLI mode)
-    for line in MESSAGES:
-        print(line)
-        time.sleep(2)
+    if not no_delay:
+        # Print the messages with 2 second interval (CLI mode), sleeping until a fixed
+        # deadline so slow terminal output doesn't add up over the run
+        deadline = time.monotonic()
+        for line in MESSAGES:
+            print(line, flush=True)
+            deadline += 2
+            time.sleep(max(0, deadline - time.monotonic()))
 
     try:
-        result = evaluate_expression(expr)
+        result = _evaluate_tokens(tokens)
         if result == 5:
             print(f"{result} 👍🏻")
         else:
@@ -103,9 +288,13 @@ def main():
 
 
 def run_gui():
-    if tk is None:
+    try:
+        import tkinter as tk
+        from tkinter import ttk
+        from tkinter import font as tkfont
+    except ImportError:
         print('Tkinter not available on this system. Falling back to CLI.')
-        return
+        return False
 
     root = tk.Tk()
     root.title('Quantum Calculator')
@@ -129,14 +318,9 @@ def run_gui():
     frm.grid(row=0, column=0, sticky='nsew')
 
     # Fonts (define early so entries can use them)
-    if tkfont is not None:
-        normal_font = tkfont.Font(size=14)
-        bold_font = tkfont.Font(size=24, weight='bold')
-        input_font = tkfont.Font(size=26, weight='bold')
-    else:
-        normal_font = None
-        bold_font = None
-        input_font = None
+    normal_font = tkfont.Font(root=root, size=14)
+    bold_font = tkfont.Font(root=root, size=24, weight='bold')
+    input_font = tkfont.Font(root=root, size=26, weight='bold')
 
     # Make five columns: outer flex columns keep group centered; inner columns hold entries and operators
     frm.columnconfigure(0, weight=1)
@@ -151,12 +335,10 @@ def run_gui():
     # place entry_a close to center (column 1)
     entry_a.grid(row=0, column=1, padx=(6, 6), sticky='e', ipadx=14, ipady=10)
     entry_a.insert(0, '')
-    # apply input font if available
-    if input_font is not None:
-        try:
-            entry_a.config(font=input_font, justify='center')
-        except Exception:
-            pass
+    try:
+        entry_a.config(font=input_font, justify='center')
+    except Exception:
+        pass
 
     # Operator selection area will go between the two entries
     op_frame = ttk.Frame(frm)
@@ -167,31 +349,36 @@ def run_gui():
     # place entry_b close to center (column 3)
     entry_b.grid(row=0, column=3, padx=(6, 6), sticky='w', ipadx=14, ipady=10)
     entry_b.insert(0, '')
-    if input_font is not None:
-        try:
-            entry_b.config(font=input_font, justify='center')
-        except Exception:
-            pass
+    try:
+        entry_b.config(font=input_font, justify='center')
+    except Exception:
+        pass
 
     # Single-line display that will be replaced every 2 seconds
     display_label = ttk.Label(frm, text='', anchor='center')
     # place display on row 2 and span all five columns (entries + operator column)
     display_label.grid(row=2, column=0, columnspan=5, pady=(12, 0), sticky='nsew')
 
-    # Fonts
-    if tkfont is not None:
-        normal_font = tkfont.Font(size=14)
-        bold_font = tkfont.Font(size=24, weight='bold')
-    else:
-        normal_font = None
-        bold_font = None
+    # Display updates are applied from an idle callback, so several updates in
+    # the same event-loop turn cost a single relayout
+    pending = {'text': None, 'bold': False, 'scheduled': False}
+    # Font currently on the label, so unchanged fonts aren't re-measured
+    last = {'bold': None}
+
+    def flush_display():
+        pending['scheduled'] = False
+        bold = pending['bold']
+        display_label.config(text=pending['text'])
+        if last['bold'] != bold:
+            display_label.config(font=bold_font if bold else normal_font)
+            last['bold'] = bold
 
     def append_display(line, bold=False):
-        display_label.config(text=line)
-        if bold and bold_font is not None:
-            display_label.config(font=bold_font)
-        elif normal_font is not None:
-            display_label.config(font=normal_font)
+        pending['text'] = line
+        pending['bold'] = bold
+        if not pending['scheduled']:
+            pending['scheduled'] = True
+            root.after_idle(flush_display)
 
     # Operator selection state
     selected = {'op': None, 'btn': None}
@@ -210,24 +397,15 @@ def run_gui():
         except Exception:
             pass
 
-    # Create operator buttons (+ - * /)
+    # Create operator buttons (+ - * /), laid out vertically
     # create larger operator buttons so they look prominent
-    plus_btn = ttk.Button(op_frame, text='+', width=14)
-    minus_btn = ttk.Button(op_frame, text='-', width=14)
-    mul_btn = ttk.Button(op_frame, text='*', width=14)
-    div_btn = ttk.Button(op_frame, text='/', width=14)
-
-    # configure commands after creation to capture button reference
-    plus_btn.config(command=lambda b=plus_btn: select_op('+', b))
-    minus_btn.config(command=lambda b=minus_btn: select_op('-', b))
-    mul_btn.config(command=lambda b=mul_btn: select_op('*', b))
-    div_btn.config(command=lambda b=div_btn: select_op('/', b))
-
-    # Layout operator buttons vertically
-    plus_btn.grid(row=0, column=0, padx=4, pady=6)
-    minus_btn.grid(row=1, column=0, padx=4, pady=6)
-    mul_btn.grid(row=2, column=0, padx=4, pady=6)
-    div_btn.grid(row=3, column=0, padx=4, pady=6)
+    op_buttons = {}
+    for sym, row in (('+', 0), ('-', 1), ('*', 2), ('/', 3)):
+        b = ttk.Button(op_frame, text=sym, width=14)
+        # configure command after creation to capture button reference
+        b.config(command=lambda s=sym, bt=b: select_op(s, bt))
+        b.grid(row=row, column=0, padx=4, pady=6)
+        op_buttons[sym] = b
 
     def start_sequence():
         # Build expression from two entry boxes and selected operator
@@ -241,11 +419,7 @@ def run_gui():
         if not a_text or not b_text:
             append_display('Enter both numbers', bold=True)
             return
-        try:
-            # try converting to float to validate numeric input
-            float(a_text)
-            float(b_text)
-        except Exception:
+        if not (_NUM_RE.fullmatch(a_text) and _NUM_RE.fullmatch(b_text)):
             append_display('Please enter valid numbers', bold=True)
             return
 
@@ -257,63 +431,35 @@ def run_gui():
         if selected.get('btn'):
             selected['btn'].config(state='disabled')
 
-        # We'll alternate between showing a message normally and then after 2s
-        # replacing it with the next message in big bold letters.
-        state = {'i': 0, 'phase': 0}  # phase 0 = show normal at i, phase 1 = show bold at i+1
-
-        def step():
-            i = state['i']
-            phase = state['phase']
-            # If phase 0: display MESSAGES[i] normal, then schedule phase 1 to show MESSAGES[i+1] bold
-            if phase == 0:
-                if i < len(MESSAGES):
-                    append_display(MESSAGES[i], bold=False)
-                    state['phase'] = 1
-                    # after 2 seconds, show next in bold
-                    root.after(2000, step)
-                else:
-                    # no more messages; evaluate
-                    try:
-                        res = evaluate_expression(expr)
-                    except Exception as e:
-                        append_display(str(e), bold=True)
-                    else:
-                        if res == 5:
-                            append_display(f"{res} 👍🏻", bold=True)
-                        else:
-                            append_display(str(res), bold=True)
-                    btn_calc.config(state='normal')
-                    entry_a.config(state='normal')
-                    entry_b.config(state='normal')
-                    if selected.get('btn'):
-                        selected['btn'].config(state='normal')
+        def finish():
+            try:
+                res = evaluate_expression(expr)
+            except Exception as e:
+                append_display(str(e), bold=True)
             else:
-                # phase 1: show next message in bold and advance index
-                j = i + 1
-                if j < len(MESSAGES):
-                    append_display(MESSAGES[j], bold=True)
-                    # advance to next index after showing bold
-                    state['i'] = j + 1
-                    state['phase'] = 0
-                    root.after(2000, step)
+                if res == 5:
+                    append_display(f"{res} 👍🏻", bold=True)
                 else:
-                    # finished list; evaluate
-                    try:
-                        res = evaluate_expression(expr)
-                    except Exception as e:
-                        append_display(str(e), bold=True)
-                    else:
-                        if res == 5:
-                            append_display(f"{res} 👍🏻", bold=True)
-                        else:
-                            append_display(str(res), bold=True)
-                    btn_calc.config(state='normal')
-                    entry_a.config(state='normal')
-                    entry_b.config(state='normal')
-                    if selected.get('btn'):
-                        selected['btn'].config(state='normal')
-
-        # kick off immediately
+                    append_display(str(res), bold=True)
+            btn_calc.config(state='normal')
+            entry_a.config(state='normal')
+            entry_b.config(state='normal')
+            if selected.get('btn'):
+                selected['btn'].config(state='normal')
+
+        # Show one message every 2 seconds, alternating between normal and big
+        # bold letters, then evaluate once the last one has shown.
+        messages = iter(_MSG_STREAM)
+
+        def step():
+            try:
+                msg, bold = next(messages)
+            except StopIteration:
+                finish()
+                return
+            append_display(msg, bold=bold)
+            root.after(2000, step)
+
         root.after(0, step)
 
     btn_calc = ttk.Button(frm, text='Calculate', command=start_sequence)
@@ -336,12 +482,17 @@ def run_gui():
     root.rowconfigure(0, weight=1)
 
     root.mainloop()
+    return True
 
 
 def run_keypad_gui():
-    if tk is None:
+    try:
+        import tkinter as tk
+        from tkinter import ttk
+        from tkinter import font as tkfont
+    except ImportError:
         print('Tkinter not available, falling back to CLI')
-        return
+        return False
 
     root = tk.Tk()
     root.title('Funny Calculator - Keypad')
@@ -367,95 +518,108 @@ def run_keypad_gui():
     disp_var = tk.StringVar(value='')
     # Display label with bold large text (green on black)
     disp = tk.Label(frm, textvariable=disp_var, anchor='center', bg='black', fg=accent, padx=8)
-    # slightly smaller display font so long messages fit better
-    disp_font = (None, 20, 'bold')
+    # slightly smaller display font so long messages fit better; the keypad
+    # buttons reuse the same Font object
+    disp_font = tkfont.Font(root=root, size=20, weight='bold')
     try:
         disp.config(font=disp_font, wraplength=default_w - 80, justify='center', relief='sunken', bd=2)
-    except Exception:
-        try:
-            disp.config(font=disp_font, relief='sunken', bd=2)
-        except Exception:
-            disp.config(font=disp_font)
+    except tk.TclError:
+        disp.config(font=disp_font)
     # make display visible above the keypad grid and give vertical padding
     disp.pack(fill='x', pady=(6, 14), ipady=12)
 
+    # Same idle-time coalescing for the display text; current() sees updates
+    # that have not been flushed yet
+    pending = {'text': None}
+
+    def flush_display():
+        disp_var.set(pending['text'])
+        pending['text'] = None
+
+    def show(text):
+        if pending['text'] is None:
+            root.after_idle(flush_display)
+        pending['text'] = text
+
+    def current():
+        if pending['text'] is not None:
+            return pending['text']
+        return disp_var.get()
+
     # Memory storage
     memory = {'val': None}
 
     buttons = []
+    # One Tcl script per state, built on first use, that reconfigures every
+    # keypad button in a single interpreter call
+    state_scripts = {}
 
     def set_buttons(state):
-        for b in buttons:
-            try:
-                b.config(state=state)
-            except Exception:
-                pass
+        script = state_scripts.get(state)
+        if script is None:
+            script = ';'.join(f'{b} configure -state {state}' for b in buttons)
+            state_scripts[state] = script
+        try:
+            root.tk.eval(script)
+        except tk.TclError:
+            pass
 
     def press(ch):
-        disp_var.set(disp_var.get() + str(ch))
+        show(current() + str(ch))
 
     def clear():
-        disp_var.set('')
+        show('')
 
     def backspace():
-        s = disp_var.get()
-        disp_var.set(s[:-1])
+        s = current()
+        show(s[:-1])
 
     def mem_store():
         try:
-            memory['val'] = disp_var.get()
-            disp_var.set('MS')
-            root.after(800, lambda: disp_var.set(''))
+            memory['val'] = current()
+            show('MS')
+            root.after(800, lambda: show(''))
         except Exception:
             pass
 
     def mem_recall():
         if memory['val'] is not None:
-            disp_var.set(disp_var.get() + str(memory['val']))
+            show(current() + str(memory['val']))
 
     def run_sequence_then_eval(expr):
         set_buttons('disabled')
-        state = {'i': 0, 'phase': 0}
-
-        def step():
-            i = state['i']
-            phase = state['phase']
-            if phase == 0:
-                if i < len(MESSAGES):
-                    disp_var.set(MESSAGES[i])
-                    state['phase'] = 1
-                    root.after(2000, step)
-                else:
-                    finish()
-            else:
-                j = i + 1
-                if j < len(MESSAGES):
-                    disp_var.set(MESSAGES[j])
-                    state['i'] = j + 1
-                    state['phase'] = 0
-                    root.after(2000, step)
-                else:
-                    finish()
 
         def finish():
             try:
                 res = evaluate_expression(expr)
             except Exception as e:
-                disp_var.set(str(e))
+                show(str(e))
             else:
                 if res == 5:
-                    disp_var.set(f"{res} 👍🏻")
+                    show(f"{res} 👍🏻")
                 else:
-                    disp_var.set(str(res))
+                    show(str(res))
             set_buttons('normal')
 
+        # Show one message every 2 seconds, then evaluate
+        messages = iter(_MSG_STREAM)
+
+        def step():
+            try:
+                msg, _ = next(messages)
+            except StopIteration:
+                finish()
+                return
+            show(msg)
+            root.after(2000, step)
+
         root.after(0, step)
 
     def equals():
-        expr = disp_var.get().strip()
+        expr = current().strip()
         if not expr:
-            disp_var.set('Enter expr')
-            root.after(800, lambda: disp_var.set(''))
+            show('Enter expr')
+            root.after(800, lambda: show(''))
             return
         run_sequence_then_eval(expr)
 
@@ -471,6 +635,15 @@ def run_keypad_gui():
         ('(', 4, 0), (')', 4, 1), ('⌫', 4, 2), ('=', 4, 3),
     ]
 
+    class KeyButton(tk.Button):
+        # Keys without a command of their own type their label into the display
+        def __init__(self, master, txt, command=None, **kw):
+            super().__init__(master, text=txt, command=command or self._fire, **kw)
+            self.key = txt
+
+        def _fire(self):
+            press(self.key)
+
     for (txt, r, c) in key_defs:
         if txt == 'C':
             cmd = clear
@@ -479,10 +652,10 @@ def run_keypad_gui():
         elif txt == '⌫':
             cmd = backspace
         else:
-            cmd = (lambda ch=txt: press(ch))
+            cmd = None
 
         # larger, bolder buttons
-        b = tk.Button(grid_frame, text=txt, command=cmd, bg=btn_bg, fg=fg, activebackground='#3a3a3a', font=(None, 20, 'bold'))
+        b = KeyButton(grid_frame, txt, command=cmd, bg=btn_bg, fg=fg, activebackground='#3a3a3a', font=disp_font)
         b.grid(row=r, column=c, sticky='nsew', padx=12, pady=12)
         buttons.append(b)
 
@@ -513,6 +686,7 @@ def run_keypad_gui():
     root.bind('<Key>', on_key)
 
     root.mainloop()
+    return True
 
 
 if __name__ == '__main__':